@@ -1,7 +1,9 @@
 import xlwings
+import numpy as np
 import pandas as pd
 import sqlite3
 import excel as ex
+import misc as mc
 
 
 class ConciveError(Exception):
@@ -510,4 +512,55 @@ def delete_TOWER_data(db_path, selected_structure):
 
 
 selected_structure = "24A535_FEED_DP-A1_L0_G0_S0"
-save_MP_data("C:/Users/aaron.lange/Desktop/Projekte/Geometrie_Converter/GeometrieConverter/databases/MP.db",selected_structure)
\ No newline at end of file
+save_MP_data("C:/Users/aaron.lange/Desktop/Projekte/Geometrie_Converter/GeometrieConverter/databases/MP.db",selected_structure)
+
+
+# %% calc_weight
+def calc_weight_old(rho, t, z_top, z_bot, d_top, d_bot):
+    """
+    Weight of a hollow frustum as outer minus inner solid frustum volume, the formula
+    used by misc.calc_weight before it was expanded.
+    """
+    d1 = d_top
+    d2 = d_bot
+    h = np.abs(z_top - z_bot)
+
+    volume = (1 / 3) * np.pi * h / 4 * (d1 ** 2 + d1 * d2 + d2 ** 2 - (d1 - 2 * t) ** 2 - (d1 - 2 * t) * (d2 - 2 * t) - (d2 - 2 * t) ** 2)
+
+    return volume * rho
+
+
+def check_calc_weight(n=10000, seed=0):
+    """
+    Compare misc.calc_weight against the original formula on random sections.
+
+    Args:
+        n (int): Number of random sections.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        float: Largest relative deviation between both formulas.
+    """
+    rng = np.random.default_rng(seed)
+
+    rho = rng.uniform(1000, 10000, n)
+    t = rng.uniform(0.005, 0.15, n)
+    z_bot = rng.uniform(-100, 100, n)
+    z_top = z_bot + rng.uniform(0.1, 30, n)
+    d_top = rng.uniform(1, 12, n)
+    d_bot = rng.uniform(1, 12, n)
+
+    old = calc_weight_old(rho, t, z_top, z_bot, d_top, d_bot)
+    new = mc.calc_weight(rho, t, z_top, z_bot, d_top, d_bot)
+
+    # scalar input and swapped z-positions
+    assert np.isclose(mc.calc_weight(rho[0], t[0], z_top[0], z_bot[0], d_top[0], d_bot[0]), old[0])
+    assert np.allclose(mc.calc_weight(rho, t, z_bot, z_top, d_top, d_bot), old)
+
+    if not np.allclose(new, old, rtol=1e-12, atol=0):
+        raise AssertionError(f"calc_weight deviates from the original formula, max rel. deviation {np.max(np.abs(new / old - 1))}")
+
+    return np.max(np.abs(new / old - 1))
+
+
+print(f"calc_weight max rel. deviation: {check_calc_weight()}")
@@ -1,8 +1,12 @@
+import atexit
+import functools
 import os.path
 import xlwings as xw
 import xlwings
+import numpy as np
 import pandas as pd
 import sqlite3
+from contextlib import contextmanager
 import excel as ex
 
 import plot as ex_plt
@@ -18,6 +22,243 @@ class ConciveError(Exception):
 
 log = ex.setup_logger()
 
+# Connection-level tuning applied to every database handle. journal_mode=WAL is
+# persistent in the database file and set once, when the connection is opened.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-64000;"
+    "PRAGMA mmap_size=268435456;"
+)
+
+# One open connection per database file, kept for the lifetime of the process
+_CONN = {}
+
+# Last loaded META table per database file, invalidated whenever META is written
+_META_CACHE = {}
+
+# Recurring statements as fixed strings, so they hit the connection's statement cache
+_SQL_TABLE_EXISTS = "SELECT 1 FROM sqlite_master WHERE type='table' AND name=? LIMIT 1"
+_SQL_META_EXISTS = 'SELECT 1 FROM "META" WHERE "Identifier"=? LIMIT 1'
+_SQL_META_DELETE = 'DELETE FROM "META" WHERE "Identifier"=?'
+_SQLITE_CACHED_STATEMENTS = 256
+
+# "?,?,...,?" placeholder lists per column count
+_PLACEHOLDERS = {}
+
+# SQLite column type per inferred pandas type (as in pandas' SQLite backend), everything else is stored as TEXT
+_SQLITE_TYPES = {
+    "string": "TEXT",
+    "floating": "REAL",
+    "integer": "INTEGER",
+    "datetime": "TIMESTAMP",
+    "date": "DATE",
+    "time": "TIME",
+    "boolean": "INTEGER",
+}
+
+
+def _connect(db_path):
+    """
+    Return the cached SQLite connection for a database, opening it on first use
+    with WAL journaling and tuned PRAGMAs.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The configured connection.
+    """
+    conn = _CONN.get(db_path)
+    if conn is not None:
+        return conn
+
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=_SQLITE_CACHED_STATEMENTS)
+
+    if db_path != ":memory:":
+        # best effort, a read-only database keeps its current journal mode
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as e:
+            log.warning(f"WAL journal mode not enabled for '{db_path}': {e}")
+        conn.executescript(_SQLITE_PRAGMAS)
+
+    _ensure_meta_index(conn)
+
+    _CONN[db_path] = conn
+    return conn
+
+
+def _table_exists(conn, Identifier):
+    """
+    Check whether a table exists, answered from the schema table without listing all tables.
+    """
+    return conn.execute(_SQL_TABLE_EXISTS, (Identifier,)).fetchone() is not None
+
+
+def _identifier_exists(conn, Identifier):
+    """
+    Check whether an Identifier is registered in the META table.
+    """
+    return conn.execute(_SQL_META_EXISTS, (Identifier,)).fetchone() is not None
+
+
+def _placeholders(n_columns):
+    """
+    Return the "?,?,...,?" parameter list for a statement with n_columns values.
+    """
+    placeholders = _PLACEHOLDERS.get(n_columns)
+    if placeholders is None:
+        placeholders = _PLACEHOLDERS[n_columns] = ",".join("?" * n_columns)
+    return placeholders
+
+
+def _meta_columns(conn):
+    """
+    Return the column names of the META table (without a legacy 'index' column).
+    """
+    cursor = conn.execute('SELECT * FROM "META" LIMIT 0')
+    return [description[0] for description in cursor.description if description[0] != 'index']
+
+
+def _ensure_meta_index(conn):
+    """
+    Create the unique index on META.Identifier if the database has a META table.
+
+    Databases that already contain duplicate identifiers, or are opened read-only,
+    are left without the index.
+    """
+    if not _table_exists(conn, "META"):
+        return
+
+    try:
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS "idx_meta_identifier" ON "META" ("Identifier")')
+    except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+        log.warning(f"Unique index on META.Identifier not created: {e}")
+
+
+def _close_connections():
+    """
+    Close all cached SQLite connections.
+    """
+    for conn in _CONN.values():
+        conn.close()
+    _CONN.clear()
+
+
+atexit.register(_close_connections)
+
+
+@contextmanager
+def _transaction(conn):
+    """
+    Run the enclosed statements as one transaction, committed once on success
+    and rolled back if any statement fails.
+
+    Args:
+        conn (sqlite3.Connection): Connection to run the transaction on.
+    """
+    conn.execute("BEGIN")
+    try:
+        yield conn
+        # a failed commit (e.g. database locked) is rolled back as well, so the cached
+        # connection is not left in an open transaction
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _sqlite_type(column):
+    """
+    Return the SQLite column type for a Series, inferred from its values like pandas' `to_sql` does,
+    so object columns holding numbers (e.g. with a stray None) are still stored as REAL/INTEGER.
+    """
+    col_type = pd.api.types.infer_dtype(column, skipna=True)
+
+    if col_type == "timedelta64":
+        col_type = "integer"
+    elif col_type == "datetime64":
+        col_type = "datetime"
+
+    return _SQLITE_TYPES.get(col_type, "TEXT")
+
+
+def _create_table(conn, Identifier, df, if_exists='fail'):
+    """
+    Write a DataFrame to a table on the given connection without committing.
+
+    The column types are inferred from the values, datetime columns are stored as ISO strings,
+    and the table is filled with a single bulk INSERT, so the write takes part in an enclosing
+    `_transaction`.
+
+    Args:
+        conn (sqlite3.Connection): Connection of the enclosing transaction.
+        Identifier (str): Name of the table to create or append to.
+        df (pd.DataFrame): DataFrame containing the data to write.
+        if_exists (str): One of 'fail', 'replace', 'append'.
+
+    Raises:
+        ValueError: If the table exists and `if_exists` is 'fail', or `if_exists` is invalid.
+    """
+    if if_exists not in ('fail', 'replace', 'append'):
+        raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
+    exists = _table_exists(conn, Identifier)
+
+    if exists and if_exists == 'fail':
+        raise ValueError(f"Table '{Identifier}' already exists.")
+    if exists and if_exists == 'replace':
+        conn.execute(f'DROP TABLE "{Identifier}"')
+        exists = False
+
+    sql_types = {col: _sqlite_type(df[col]) for col in df.columns}
+
+    if not exists:
+        columns = ", ".join(f'"{col}" {sql_type}' for col, sql_type in sql_types.items())
+        conn.execute(f'CREATE TABLE "{Identifier}" ({columns})')
+
+    # Timestamps can't be bound by sqlite3, write them as ISO strings (NaT as NULL)
+    datetime_cols = [col for col, sql_type in sql_types.items() if sql_type == "TIMESTAMP"]
+    if datetime_cols:
+        df = df.copy()
+        for col in datetime_cols:
+            df[col] = pd.Series(
+                [None if pd.isna(value) else pd.Timestamp(value).isoformat(sep=" ") for value in df[col]],
+                index=df.index, dtype=object
+            )
+
+    # name the columns, so appended frames are matched by column name and not by position
+    columns = ", ".join(f'"{col}"' for col in df.columns)
+    placeholders = _placeholders(len(df.columns))
+    conn.executemany(f'INSERT INTO "{Identifier}" ({columns}) VALUES ({placeholders})', df.itertuples(index=False, name=None))
+
+    if Identifier == "META":
+        _ensure_meta_index(conn)
+
+
+def _has_nan(df):
+    """
+    Check a DataFrame for NaN/None values, using np.isnan directly on float data.
+    """
+    values = df.to_numpy()
+    if values.dtype.kind == "f":
+        return bool(np.isnan(values).any())
+    return bool(pd.isna(values).any())
+
+
+def _valid_structure_data(excel_filename, Structure_data):
+    """
+    Check structure data for invalid (NaN) values and warn the user if any are found.
+
+    Returns:
+        bool: True if the data contains no NaN values.
+    """
+    if _has_nan(Structure_data):
+        ex.show_message_box(excel_filename, "Structure data contains invalid (NaN) values. Please correct them before proceeding.")
+        return False
+    return True
+
 
 def drop_db_table(excel_filename, db_path, Identifier):
     """
@@ -41,7 +282,7 @@ def drop_db_table(excel_filename, db_path, Identifier):
     - Errors are shown via message box and do not raise exceptions.
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
     except sqlite3.Error as e:
         ex.show_message_box(
             excel_filename,
@@ -49,6 +290,9 @@ def drop_db_table(excel_filename, db_path, Identifier):
         )
         return False
 
+    if Identifier == "META":
+        _META_CACHE.pop(db_path, None)
+
     try:
         conn.execute(f'DROP TABLE IF EXISTS "{Identifier}"')
         conn.commit()
@@ -58,8 +302,6 @@ def drop_db_table(excel_filename, db_path, Identifier):
             f"Failed to drop table '{Identifier}'.\nPython Error: {e}"
         )
         return False
-    finally:
-        conn.close()
 
     return True
 
@@ -82,38 +324,95 @@ def load_db_table(db_path, Identifier, dtype=None):
     if not isinstance(Identifier, str):
         raise ConciveError(f"Identifier must be a string, got {type(Identifier)}.")
 
+    if Identifier == "META" and db_path in _META_CACHE:
+        return _apply_dtype(_META_CACHE[db_path].copy(), dtype)
+
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
     except sqlite3.Error as e:
         raise ConciveError(f"Failed to connect to the database: {e}")
 
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        table_names = [table[0] for table in cursor.fetchall()]
+        exists = _table_exists(conn, Identifier)
     except sqlite3.Error as e:
-        conn.close()
         raise ConciveError(f"Failed to retrieve table names: {e}")
 
-    if Identifier not in table_names:
-        conn.close()
+    if not exists:
+        table_names = [table[0] for table in conn.execute("SELECT name FROM sqlite_master WHERE type='table';")]
         raise ConciveError(f"Table '{Identifier}' does not exist in the database. Available tables: {table_names}")
 
     try:
-        query = f'SELECT * FROM "{Identifier}"'
-        df = pd.read_sql_query(query, conn)
+        df = _read_query(conn.cursor(), f'SELECT * FROM "{Identifier}"')
     except Exception as e:
-        conn.close()
         raise ConciveError(f"Failed to load table '{Identifier}': {e}")
-    finally:
-        conn.close()
+
+    if Identifier == "META":
+        _META_CACHE[db_path] = df.copy()
+
+    return _apply_dtype(df, dtype)
+
+
+def load_structure_tables(db_path, Identifier):
+    """
+    Load the META row, data table and added masses table of one structure.
+
+    The three tables are read back to back in a single read transaction,
+    the META row is selected in SQL.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+        Identifier (str): Identifier of the structure to load.
+
+    Returns:
+        tuple: (META, DATA, MASSES) DataFrames.
+
+    Raises:
+        ConciveError: If database connection fails or a table does not exist.
+    """
+    try:
+        conn = _connect(db_path)
+    except sqlite3.Error as e:
+        raise ConciveError(f"Failed to connect to the database: {e}")
+
+    try:
+        conn.execute("BEGIN")
+        try:
+            cursor = conn.cursor()
+            META = _read_query(cursor, 'SELECT * FROM "META" WHERE "Identifier"=?', (Identifier,))
+            DATA = _read_query(cursor, f'SELECT * FROM "{Identifier}"')
+            MASSES = _read_query(cursor, f'SELECT * FROM "{Identifier}__ADDED_MASSES"')
+        finally:
+            conn.commit()
+    except sqlite3.Error as e:
+        raise ConciveError(f"Failed to load structure '{Identifier}': {e}")
+
+    return META, DATA, MASSES
+
+
+def _read_query(cursor, query, parameters=()):
+    """
+    Run a SELECT on the given cursor and return the result as a DataFrame,
+    without the 'index' column if present.
+    """
+    cursor.execute(query, parameters)
+    columns = [description[0] for description in cursor.description]
+    df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
 
     # Optional: Remove 'index' column if it exists
     if 'index' in df.columns:
         df = df.drop(columns=['index'])
 
-    # Optional: Apply dtype conversion
-    if dtype is not None:
+    return df
+
+
+def _apply_dtype(df, dtype):
+    """
+    Apply an optional dtype conversion to a table loaded by `load_db_table`.
+
+    Raises:
+        ConciveError: If the conversion fails.
+    """
+    if dtype is not None and not _dtypes_match(df, dtype):
         try:
             df = df.astype(dtype)
         except Exception as e:
@@ -122,6 +421,24 @@ def load_db_table(db_path, Identifier, dtype=None):
     return df
 
 
+def _dtypes_match(df, dtype):
+    """
+    Check whether the columns of df already have the requested dtype(s), so the
+    copying astype can be skipped.
+    """
+    try:
+        if isinstance(dtype, dict):
+            return all(
+                col in df.columns and df[col].dtype == pd.api.types.pandas_dtype(t)
+                for col, t in dtype.items()
+            )
+        target = pd.api.types.pandas_dtype(dtype)
+    except TypeError:
+        return False
+
+    return all(df_dtype == target for df_dtype in df.dtypes)
+
+
 def create_db_table(excel_filename, db_path, Identifier, df, if_exists='fail'):
     """
     Creates or appends to a table in an SQLite database from a pandas DataFrame.
@@ -144,11 +461,11 @@ def create_db_table(excel_filename, db_path, Identifier, df, if_exists='fail'):
 
     Notes
     -----
-    - Uses pandas `to_sql()` under the hood.
+    - The table is written with a bulk `executemany` INSERT in a single transaction.
     - Shows message boxes via `ex.show_message_box()` on failure.
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
     except sqlite3.Error as e:
         ex.show_message_box(
             excel_filename,
@@ -157,20 +474,21 @@ def create_db_table(excel_filename, db_path, Identifier, df, if_exists='fail'):
         return False
 
     try:
-        df.to_sql(Identifier, conn, if_exists=if_exists, index=False)
+        with _transaction(conn):
+            if Identifier == "META":
+                _META_CACHE.pop(db_path, None)
+            _create_table(conn, Identifier, df, if_exists=if_exists)
     except Exception as e:
         ex.show_message_box(
             excel_filename,
             f"Failed to create or write to table '{Identifier}'.\nPython Error: {e}"
         )
         return False
-    finally:
-        conn.close()
 
     return True
 
 
-def add_db_element(excel_filename, db_path, Structure_data, added_masses_data, Meta_values):
+def add_db_element(excel_filename, db_path, Structure_data, added_masses_data, Meta_values, META=None):
     """
     Adds a new structure entry to the database using the provided data.
 
@@ -186,6 +504,9 @@ def add_db_element(excel_filename, db_path, Structure_data, added_masses_data, M
         List of metadata values in the correct order. This must match the order of columns
         in the existing 'META' table in the database:
         ["Identifier", "Project ID", "Phase", "Structure ID", "Water Depth", "Height Reference", "comments"]
+    META : pd.DataFrame, optional
+        Already loaded 'META' table of the database, used for its column schema.
+        The schema is read from the database if not given.
 
     Notes
     -----
@@ -195,9 +516,13 @@ def add_db_element(excel_filename, db_path, Structure_data, added_masses_data, M
         - The number of metadata values is incorrect
         - The identifier already exists in the database
     """
-    # Load existing META table and schema
-    META = load_db_table(db_path, "META")
-    meta_columns = META.columns.tolist()
+    conn = _connect(db_path)
+
+    # META schema
+    if META is not None:
+        meta_columns = META.columns.tolist()
+    else:
+        meta_columns = _meta_columns(conn)
     Meta_values = list(Meta_values)
 
     if len(Meta_values) != len(meta_columns):
@@ -208,27 +533,30 @@ def add_db_element(excel_filename, db_path, Structure_data, added_masses_data, M
         return False
 
     Identifier = Meta_values[0]
-    if Identifier in META["Identifier"].values:
+    if _identifier_exists(conn, Identifier):
         ex.show_message_box(
             excel_filename,
             "The provided Identifier already exists in the database. Please provide a unique name."
         )
         return False
 
-    # Convert list to DataFrame with correct columns
-    Meta_infos = pd.DataFrame([Meta_values], columns=meta_columns)
-
-    # Save structure data
-    if not create_db_table(excel_filename, db_path, Identifier, Structure_data, if_exists='fail'):
-        return False
-
-    # Save added masses data
-    if not create_db_table(excel_filename, db_path, f"{Identifier}__ADDED_MASSES", added_masses_data, if_exists='fail'):
-        return False
+    columns = ", ".join(f'"{col}"' for col in meta_columns)
+    placeholders = _placeholders(len(meta_columns))
 
-    # Append new metadata row and save updated META table
-    META = pd.concat([META, Meta_infos], ignore_index=True)
-    if not create_db_table(excel_filename, db_path, "META", META, if_exists='replace'):
+    try:
+        with _transaction(conn):
+            # Save structure and added masses data
+            _create_table(conn, Identifier, Structure_data, if_exists='fail')
+            _create_table(conn, f"{Identifier}__ADDED_MASSES", added_masses_data, if_exists='fail')
+
+            # Append new metadata row to the META table
+            _META_CACHE.pop(db_path, None)
+            conn.execute(f'INSERT INTO "META" ({columns}) VALUES ({placeholders})', Meta_values)
+    except Exception as e:
+        ex.show_message_box(
+            excel_filename,
+            f"Failed to save new database entry '{Identifier}'.\nPython Error: {e}"
+        )
         return False
 
     ex.show_message_box(excel_filename, f"Data saved in new database entry '{Identifier}'.")
@@ -258,23 +586,26 @@ def delete_db_element(excel_filename, db_path, Identifier):
         - '{Identifier}__ADDED_MASSES'
     - If any step fails, an error message is shown and the operation is aborted.
     """
-    META = load_db_table(db_path, "META")
+    conn = _connect(db_path)
 
-    if Identifier not in META["Identifier"].values:
+    if not _identifier_exists(conn, Identifier):
         ex.show_message_box(
             excel_filename,
             f"No entry found for Identifier '{Identifier}' in the database."
         )
         return False
 
-    # Remove the identifier row from META
-    META = META[META["Identifier"] != Identifier]
-
-    if not drop_db_table(excel_filename, db_path, Identifier):
-        return False
-    if not drop_db_table(excel_filename, db_path, f"{Identifier}__ADDED_MASSES"):
-        return False
-    if not create_db_table(excel_filename, db_path, "META", META, if_exists='replace'):
+    try:
+        with _transaction(conn):
+            _META_CACHE.pop(db_path, None)
+            conn.execute(_SQL_META_DELETE, (Identifier,))
+            conn.execute(f'DROP TABLE IF EXISTS "{Identifier}"')
+            conn.execute(f'DROP TABLE IF EXISTS "{Identifier}__ADDED_MASSES"')
+    except Exception as e:
+        ex.show_message_box(
+            excel_filename,
+            f"Failed to delete structure '{Identifier}'.\nPython Error: {e}"
+        )
         return False
 
     ex.show_message_box(excel_filename, f"Deleted structure '{Identifier}' from the database.")
@@ -308,36 +639,52 @@ def replace_db_element(excel_filename, db_path, Structure_data, added_masses_dat
     - If the identifier is changed (`old_id` → `new_id`), the old entry and its tables will be dropped.
     - The function checks for duplicate identifiers before proceeding.
     """
-    META = load_db_table(db_path, "META", dtype=str)
+    conn = _connect(db_path)
     Meta_infos = list(Meta_infos)
     new_id = Meta_infos[0]
 
     # Check for existing entry and valid update
-    if old_id not in META["Identifier"].values:
+    if not _identifier_exists(conn, old_id):
         ex.show_message_box(excel_filename, f"No existing entry found for '{old_id}' in the database.")
         return False
 
-    # Replace row in META
-    META.loc[META["Identifier"] == old_id, :] = Meta_infos
+    meta_columns = _meta_columns(conn)
+    if len(Meta_infos) != len(meta_columns):
+        ex.show_message_box(
+            excel_filename,
+            f"The number of provided metadata values ({len(Meta_infos)}) does not match the expected number of columns ({len(meta_columns)})."
+        )
+        return False
 
     # Ensure no duplicate Identifiers after update
-    if META["Identifier"].value_counts().get(new_id, 0) > 1:
-        ex.show_message_box(excel_filename, f"The identifier '{new_id}' is already used more than once. Please choose a unique name.")
+    if new_id != old_id and _identifier_exists(conn, new_id):
+        ex.show_message_box(excel_filename, f"The identifier '{new_id}' is already used in the database. Please choose a unique name.")
         return False
 
-    # Save new data
-    if not hardwrite_db_element_data(excel_filename, db_path, new_id, Structure_data, added_masses_data):
+    if not _valid_structure_data(excel_filename, Structure_data):
         return False
 
-    # Drop old tables if identifier was changed
-    if new_id != old_id:
-        if not drop_db_table(excel_filename, db_path, old_id):
-            return False
-        if not drop_db_table(excel_filename, db_path, f"{old_id}__ADDED_MASSES"):
-            return False
+    assignments = ", ".join(f'"{col}"=?' for col in meta_columns)
 
-    # Save updated META table
-    if not create_db_table(excel_filename, db_path, "META", META, if_exists="replace"):
+    try:
+        with _transaction(conn):
+            # Save new data
+            _create_table(conn, new_id, Structure_data, if_exists="replace")
+            _create_table(conn, f"{new_id}__ADDED_MASSES", added_masses_data, if_exists="replace")
+
+            # Drop old tables if identifier was changed
+            if new_id != old_id:
+                conn.execute(f'DROP TABLE IF EXISTS "{old_id}"')
+                conn.execute(f'DROP TABLE IF EXISTS "{old_id}__ADDED_MASSES"')
+
+            # Replace row in META
+            _META_CACHE.pop(db_path, None)
+            conn.execute(f'UPDATE "META" SET {assignments} WHERE "Identifier"=?', Meta_infos + [old_id])
+    except Exception as e:
+        ex.show_message_box(
+            excel_filename,
+            f"Failed to replace database entry '{old_id}'.\nPython Error: {e}"
+        )
         return False
 
     ex.show_message_box(excel_filename, f"Data for '{old_id}' successfully replaced with new entry '{new_id}'.")
@@ -369,14 +716,19 @@ def hardwrite_db_element_data(excel_filename, db_path, change_id, Structure_data
     - Both tables will be replaced (`if_exists='replace'`).
     - A warning is shown if invalid (NaN) values are detected in `Structure_data`.
     """
-    if pd.isna(Structure_data.values).any():
-        ex.show_message_box(excel_filename, "Structure data contains invalid (NaN) values. Please correct them before proceeding.")
-        return False
-
-    if not create_db_table(excel_filename, db_path, change_id, Structure_data, if_exists="replace"):
+    if not _valid_structure_data(excel_filename, Structure_data):
         return False
 
-    if not create_db_table(excel_filename, db_path, f"{change_id}__ADDED_MASSES", added_masses_data, if_exists="replace"):
+    try:
+        conn = _connect(db_path)
+        with _transaction(conn):
+            _create_table(conn, change_id, Structure_data, if_exists="replace")
+            _create_table(conn, f"{change_id}__ADDED_MASSES", added_masses_data, if_exists="replace")
+    except Exception as e:
+        ex.show_message_box(
+            excel_filename,
+            f"Failed to write data for '{change_id}'.\nPython Error: {e}"
+        )
         return False
 
     return True
@@ -398,7 +750,6 @@ def load_META(excel_filename, Structure, db_path):
     Returns:
         None
     """
-    logger = ex.setup_logger()
     sheet_name_structure_loading = "BuildYourStructure"
 
     META = load_db_table(db_path, "META")
@@ -425,21 +776,22 @@ def load_DATA(excel_filename, Structure, Structure_name, db_path):
     Returns:
         None
     """
-    logger = ex.setup_logger()
     sheet_name_structure_loading = "BuildYourStructure"
 
-    META = load_db_table(db_path, "META")
-    DATA = load_db_table(db_path, Structure_name)
-    MASSES = load_db_table(db_path, Structure_name + "__ADDED_MASSES")
+    META_relevant, DATA, MASSES = load_structure_tables(db_path, Structure_name)
 
-    META_relevant = META.loc[META["Identifier"] == Structure_name]
+    ex.write_df_to_tables(excel_filename, sheet_name_structure_loading, [
+        (f"{Structure}_META", META_relevant),
+        (f"{Structure}_DATA", DATA),
+        (f"{Structure}_MASSES", MASSES),
+    ])
 
-    ex.write_df_to_table(excel_filename, sheet_name_structure_loading, f"{Structure}_META_TRUE", META_relevant)
-    ex.write_df_to_table(excel_filename, sheet_name_structure_loading, f"{Structure}_META", META_relevant)
-    ex.write_df_to_table(excel_filename, sheet_name_structure_loading, f"{Structure}_DATA_TRUE", DATA)
-    ex.write_df_to_table(excel_filename, sheet_name_structure_loading, f"{Structure}_DATA", DATA)
-    ex.write_df_to_table(excel_filename, sheet_name_structure_loading, f"{Structure}_MASSES_TRUE", MASSES)
-    ex.write_df_to_table(excel_filename, sheet_name_structure_loading, f"{Structure}_MASSES", MASSES)
+    # the *_TRUE tables mirror the loaded state, copied inside Excel
+    ex.copy_tables(excel_filename, sheet_name_structure_loading, [
+        (f"{Structure}_META", f"{Structure}_META_TRUE"),
+        (f"{Structure}_DATA", f"{Structure}_DATA_TRUE"),
+        (f"{Structure}_MASSES", f"{Structure}_MASSES_TRUE"),
+    ])
 
     ex.clear_excel_table_contents(excel_filename, sheet_name_structure_loading, f"{Structure}_META_NEW")
     ex.call_vba_dropdown_macro(excel_filename, sheet_name_structure_loading, f"Dropdown_{Structure}_Structures2", Structure_name)
@@ -476,15 +828,16 @@ def save_data(excel_filename, Structure, db_path, selected_structure):
         The name of the structure after the operation (could be a new name or the same).
     """
 
-    def saving_logic(META_FULL, META_DB, META_CURR, META_CURR_NEW, DATA_DB, DATA_CURR, MASSES_DB, MASSES_CURR):
+    def saving_logic(META_FULL, META_DB, META_CURR, META_CURR_NEW, get_DATA_DB, DATA_CURR, get_MASSES_DB, MASSES_CURR):
 
         def valid_data(data):
-            if pd.isna(data.values).any():
-                return False, data
             try:
-                return True, data.astype(float)
+                values = data.to_numpy(dtype=np.float64)
             except (ValueError, TypeError):
                 return False, data
+            if np.isnan(values).any():
+                return False, data
+            return True, pd.DataFrame(values, index=data.index, columns=data.columns)
 
         succes, DATA_CURR = valid_data(DATA_CURR)
 
@@ -493,28 +846,28 @@ def save_data(excel_filename, Structure, db_path, selected_structure):
                                     "Invalid data found in Structure data! Aborting.")
             return False, _
 
-        # check, if data has changed
-        data_changed = not (DATA_DB.equals(DATA_CURR)) or not (MASSES_DB.equals(MASSES_CURR))
-
-        # check, if values are in META
+        # check, if values are in META (compared as one homogeneous string array)
         if META_CURR.empty:
             meta_loaded_changed = False
         else:
-            meta_loaded_changed = (META_CURR.values[0][:-1] != '').any()
+            meta_loaded_changed = (META_CURR.iloc[0, :-1].to_numpy(dtype=str) != '').any()
 
         # check, if values are in META_NEW
         if META_CURR_NEW.empty:
             meta_new_populated = False
+            meta_new_complete = False
         else:
-            meta_new_populated = (META_CURR_NEW.values[0][:-1] != '').any()
+            populated = META_CURR_NEW.iloc[0, :-1].to_numpy(dtype=str) != ''
+            meta_new_populated = populated.any()
+            meta_new_complete = populated.all()
 
         if meta_new_populated:
-            if ((META_CURR_NEW.values[0][0:-1] == '').any()):
+            if not meta_new_complete:
                 _ = ex.show_message_box(excel_filename,
                                         "Please fully populate the NEW Meta table to create a new DB entry or clear it of all data to overwrite the loaded Structure")
                 return False, _
 
-            sucess = add_db_element(excel_filename, db_path, DATA_CURR, MASSES_CURR, META_CURR_NEW.values[0])
+            sucess = add_db_element(excel_filename, db_path, DATA_CURR, MASSES_CURR, META_CURR_NEW.values[0], META=META_FULL)
 
             if sucess:
                 return True, META_CURR_NEW["Identifier"].values[0]
@@ -522,7 +875,7 @@ def save_data(excel_filename, Structure, db_path, selected_structure):
                 return False, None
 
         if meta_loaded_changed:
-            if not ((META_CURR.values[0][0:-1] != None).all()):
+            if not META_CURR.iloc[0, :-1].notna().all():
                 _ = ex.show_message_box(excel_filename, "Please fully populate the Current Meta table to modify the DB entry.")
                 return False, _
             if selected_structure == "":
@@ -535,6 +888,9 @@ def save_data(excel_filename, Structure, db_path, selected_structure):
             else:
                 return False, None
 
+        # check, if data has changed, the database tables are only loaded at this point
+        data_changed = not (get_DATA_DB().equals(DATA_CURR)) or not (get_MASSES_DB().equals(MASSES_CURR))
+
         if data_changed:
             sucess = hardwrite_db_element_data(excel_filename, db_path, selected_structure, DATA_CURR, MASSES_CURR)
 
@@ -562,13 +918,13 @@ def save_data(excel_filename, Structure, db_path, selected_structure):
     META_DB = META_FULL.loc[META_FULL["Identifier"] == selected_structure]
 
     if selected_structure != "":
-        DATA_DB = load_db_table(db_path, selected_structure)
-        MASSES_DB = load_db_table(db_path, selected_structure + "__ADDED_MASSES")
+        get_DATA_DB = functools.partial(load_db_table, db_path, selected_structure, dtype=float)
+        get_MASSES_DB = functools.partial(load_db_table, db_path, selected_structure + "__ADDED_MASSES")
     else:
-        DATA_DB = pd.DataFrame()
-        MASSES_DB = pd.DataFrame()
+        get_DATA_DB = pd.DataFrame
+        get_MASSES_DB = pd.DataFrame
 
-    saved, structure_load_after = saving_logic(META_FULL, META_DB, META_CURR, META_CURR_NEW, DATA_DB, DATA_CURR, MASSES_DB, MASSES_CURR)
+    saved, structure_load_after = saving_logic(META_FULL, META_DB, META_CURR, META_CURR_NEW, get_DATA_DB, DATA_CURR, get_MASSES_DB, MASSES_CURR)
 
     if saved:
         load_META(excel_filename, Structure, db_path)
@@ -579,8 +935,7 @@ def save_data(excel_filename, Structure, db_path, selected_structure):
 def delete_data(excel_filename, Structure, db_path, selected_structure):
     answer = ex.show_message_box(excel_filename, f"Are you sure you want to delete the structure {selected_structure} from the database?", icon="vbYesNo",
                                  buttons="vbYesNo")
-    logger = ex.setup_logger()
-    logger.debug(answer)
+    log.debug(answer)
     if answer == "Yes":
         delete_db_element(excel_filename, db_path, selected_structure)
 
@@ -646,16 +1001,49 @@ def delete_MP_data(excel_caller, db_path, selected_structure):
     return
 
 
+def _read_geometry_block(MP_path):
+    """
+    Read the geometry block (C1:H1000 on the 'Geometry' sheet) of an MP_tool file in one
+    Excel round-trip, the section tables are then cut out of the block instead of being read
+    with separate range reads.
+
+    Args:
+        MP_path (str): Path to the MP_tool xlsm file.
+
+    Returns:
+        tuple: The raw block (row i is sheet row i + 1) and the block rows holding a
+        'Section' heading in column C.
+    """
+    block = ex.read_excel_range(MP_path, "Geometry", "C1:H1000", use_header=False)
+    section_rows = np.flatnonzero(block.iloc[:, 0].to_numpy() == "Section")
+    return block, section_rows
+
+
+def _geometry_section(block, header_row, end_row=None):
+    """
+    Cut a section table out of a geometry block read by `_read_geometry_block`.
+
+    Args:
+        block (pd.DataFrame): Raw geometry block.
+        header_row (int): Block row holding the column headers of the section.
+        end_row (int, optional): Block row after the last data row. Defaults to the end of the block.
+
+    Returns:
+        pd.DataFrame: Section data as float, without empty rows.
+    """
+    Data = block.iloc[header_row + 1:end_row].copy()
+    Data.columns = block.iloc[header_row].tolist()
+    return Data.astype(float).dropna(how="all").reset_index(drop=True)
+
+
 def load_MP_from_MPTool(excel_caller, MP_path):
     excel_filename = os.path.basename(excel_caller)
 
     try:
-        Section_col = ex.read_excel_range(MP_path, "Geometry", "C1:C1000")
-        Section_col = Section_col.iloc[:, 0].dropna()
-        row_MP = Section_col[Section_col == "Section"].index.values[1]
+        block, section_rows = _read_geometry_block(MP_path)
+        row_MP = section_rows[1]
 
-        Data = ex.read_excel_range(MP_path, "Geometry", f"C{row_MP + 3}:H1000", dtype=float)
-        Data = Data.dropna(how="all")
+        Data = _geometry_section(block, row_MP + 1)
         ex.write_df_to_table(excel_filename, "BuildYourStructure", "MP_DATA", Data)
     except Exception as e:
         ex.show_message_box(excel_filename,
@@ -904,13 +1292,11 @@ def load_TP_from_MPTool(excel_caller, MP_path):
     excel_filename = os.path.basename(excel_caller)
 
     try:
-        Section_col = ex.read_excel_range(MP_path, "Geometry", "C1:C1000")
-        Section_col = Section_col.iloc[:, 0].dropna()
-        row_TP = Section_col[Section_col == "Section"].index.values[0]
-        row_MP = Section_col[Section_col == "Section"].index.values[1]
+        block, section_rows = _read_geometry_block(MP_path)
+        row_TP = section_rows[0]
+        row_MP = section_rows[1]
 
-        Data = ex.read_excel_range(MP_path, "Geometry", f"C{row_TP + 3}:H{row_MP - 2}", dtype=float)
-        Data = Data.dropna(how="all")
+        Data = _geometry_section(block, row_TP + 1, row_MP - 3)
         ex.write_df_to_table(excel_filename, "BuildYourStructure", "TP_DATA", Data)
     except Exception as e:
         ex.show_message_box(excel_filename,
@@ -180,12 +180,88 @@ def write_df_to_table(workbook_name, sheet_name, table_name, dataframe):
     wb = xw.books[workbook_name]
     ws = wb.sheets[sheet_name]
 
-    # Find the table (ListObject)
+    _write_df_to_listobject(ws, sheet_name, table_name, dataframe)
+
+
+def write_df_to_tables(workbook_name, sheet_name, tables):
+    """
+    Replace the contents of several Excel tables on one sheet in a single batch.
+
+    The workbook is looked up once and screen updating, events and automatic
+    calculation are switched off while writing, then restored.
+
+    Parameters:
+    - workbook_name: str, name of the open Excel workbook (no path needed if open).
+    - sheet_name: str, name of the sheet containing the tables.
+    - tables: list of (table_name, dataframe) tuples, written in the given order.
+    """
+    wb = xw.books[workbook_name]
+    ws = wb.sheets[sheet_name]
+
+    with wb.app.properties(screen_updating=False, enable_events=False, calculation="manual"):
+        for table_name, dataframe in tables:
+            _write_df_to_listobject(ws, sheet_name, table_name, dataframe)
+
+
+def copy_tables(workbook_name, sheet_name, tables):
+    """
+    Copy the contents of Excel tables onto other tables of the same sheet.
+
+    The copy runs inside Excel (Range.Copy), so the data is not transferred
+    to Python and back. Screen updating, events and automatic calculation
+    are switched off while copying, then restored.
+
+    Parameters:
+    - workbook_name: str, name of the open Excel workbook (no path needed if open).
+    - sheet_name: str, name of the sheet containing the tables.
+    - tables: list of (source_table_name, target_table_name) tuples.
+    """
+    wb = xw.books[workbook_name]
+    ws = wb.sheets[sheet_name]
+
+    with wb.app.properties(screen_updating=False, enable_events=False, calculation="manual"):
+        for source_name, target_name in tables:
+            source = _get_listobject(ws, sheet_name, source_name)
+            target = _get_listobject(ws, sheet_name, target_name)
+
+            # Clear existing table data (keep headers)
+            if target.DataBodyRange is not None and target.DataBodyRange.Rows.Count > 0:
+                target.DataBodyRange.ClearContents()
+
+            source_body = source.DataBodyRange
+            if source_body is None:
+                continue
+
+            # Copy below the target headers and resize the target table
+            header_range = target.HeaderRowRange
+            source_body.Copy(ws.range((header_range.Row + 1, header_range.Column)).api)
+
+            last_row = header_range.Row + source_body.Rows.Count
+            last_col = header_range.Column + source_body.Columns.Count - 1
+            new_range = ws.range(
+                (header_range.Row, header_range.Column),
+                (last_row, last_col)
+            )
+            target.Resize(new_range.api)
+
+
+def _get_listobject(ws, sheet_name, table_name):
+    """
+    Return the Excel table (ListObject) with the given name on a sheet.
+    """
     try:
-        table = ws.api.ListObjects(table_name)
+        return ws.api.ListObjects(table_name)
     except Exception as e:
         raise ValueError(f"Table '{table_name}' not found in sheet '{sheet_name}'.") from e
 
+
+def _write_df_to_listobject(ws, sheet_name, table_name, dataframe):
+    """
+    Write a DataFrame into the body of an Excel table (ListObject) on a sheet and resize it.
+    """
+    # Find the table (ListObject)
+    table = _get_listobject(ws, sheet_name, table_name)
+
     # Get the header range and data body range
     header_range = table.HeaderRowRange
     data_body_range = table.DataBodyRange
@@ -336,7 +412,35 @@ def read_excel_table(workbook_name, sheet_name, table_name, dtype=None, dropnan=
     """
 
     wb = xw.Book(workbook_name)
-    sheet = wb.sheets[sheet_name]
+    return _read_table(wb.sheets[sheet_name], table_name, dtype=dtype, dropnan=dropnan)
+
+
+def read_excel_tables(workbook_name, tables):
+    """
+    Read several Excel Tables into Pandas DataFrames, looking up the workbook once.
+
+    Parameters:
+        workbook_name (str): The name of the workbook
+        tables (list): (sheet_name, table_name) or (sheet_name, table_name, kwargs) tuples,
+            where kwargs is a dict of the `read_excel_table` options (dtype, dropnan).
+
+    Returns:
+        dict: DataFrames keyed by table name.
+    """
+    wb = xw.Book(workbook_name)
+
+    frames = {}
+    for sheet_name, table_name, *options in tables:
+        kwargs = options[0] if options else {}
+        frames[table_name] = _read_table(wb.sheets[sheet_name], table_name, **kwargs)
+
+    return frames
+
+
+def _read_table(sheet, table_name, dtype=None, dropnan=False):
+    """
+    Read an Excel Table of an xlwings sheet into a Pandas DataFrame, see `read_excel_table`.
+    """
     table = sheet.tables[table_name]
 
     data_range = table.data_body_range
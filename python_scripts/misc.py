@@ -3,9 +3,22 @@ import numpy as np
 import pandas as pd
 import excel as ex
 
+# Affiliation of a structure section, stored as a categorical column
+AFFILIATION_DTYPE = pd.CategoricalDtype(["MP", "TP", "TOWER", "SKIRT"])
+
 
 def valid_data(data):
-    if pd.isna(data.values).any():
+    values = data.to_numpy()
+
+    # numeric already, only nan has to be ruled out
+    if values.dtype == np.float64:
+        if np.isnan(values).any():
+            return False, data
+        if all(dtype == np.float64 for dtype in data.dtypes):
+            return True, data
+        return True, pd.DataFrame(values, index=data.index, columns=data.columns)
+
+    if pd.isna(values).any():
         return False, data
     try:
         return True, data.astype(float)
@@ -15,9 +28,13 @@ def valid_data(data):
 
 def sanity_check_structure(excel_filename, df):
     # check, if sections are on top of each other
-    height_diff = (df["Top [m]"].values[1:] - df["Bottom [m]"].values[:-1]) == 0
-    if not all(height_diff):
-        missaligned_sections = [int(df.iloc[i, 0]) for i, value in enumerate(height_diff) if not value]
+    height_diff = df["Top [m]"].values[1:] - df["Bottom [m]"].values[:-1]
+    missaligned = np.flatnonzero(height_diff != 0)
+    if missaligned.size:
+        if "Section" in df.columns:
+            missaligned_sections = df["Section"].values[missaligned].astype(int).tolist()
+        else:
+            missaligned_sections = (missaligned + 1).tolist()
         ex.show_message_box(excel_filename, f"The Sections are overlapping or have space in between at Section(s): {missaligned_sections} ")
         return False
     else:
@@ -30,7 +47,7 @@ def check_convert_structure(excel_filename, df: pd.DataFrame, Table):
         ex.show_message_box(excel_filename, f"The {Table} Table containes invalid data (nan or non numerical)")
         return success, df
 
-    success = sanity_check_structure
+    success = sanity_check_structure(excel_filename, df)
     return success, df
 
 
@@ -51,6 +68,12 @@ def center_of_mass_hollow_frustum(d1, d2, z_bot, z_top, t):
     Returns:
     z_cm   : float or np.ndarray - z-position of the center of mass
     """
+    # Scalar input, closed form (see below) in numpy floats, so a zero denominator
+    # gives inf/nan like the array path instead of raising ZeroDivisionError
+    if all(np.isscalar(x) for x in (d1, d2, z_bot, z_top, t)):
+        d1, d2, z_bot, z_top, t = (np.float64(x) for x in (d1, d2, z_bot, z_top, t))
+        return z_bot + (z_top - z_bot) * (d1 + 2 * d2 + 3 * t) / (3 * (d1 + d2 + 2 * t))
+
     # Convert to numpy arrays
     d1 = np.asarray(d1, dtype=np.float64)
     d2 = np.asarray(d2, dtype=np.float64)
@@ -58,54 +81,41 @@ def center_of_mass_hollow_frustum(d1, d2, z_bot, z_top, t):
     z_top = np.asarray(z_top, dtype=np.float64)
     t = np.asarray(t, dtype=np.float64)
 
-    # Compute height and radii
-    h = z_top - z_bot
-    r1 = d1 / 2
-    r2 = d2 / 2
-    R1 = r1 + t
-    R2 = r2 + t
-
-    # Volume and center of mass for solid frustum
-    def volume(r1, r2, h):
-        return (np.pi * h / 3) * (r1 ** 2 + r1 * r2 + r2 ** 2)
+    # The wall cross-section grows linearly with z, so the first moment over the
+    # volume of the wall (outer minus inner solid frustum) reduces to
+    # z_cm_rel = h * (d1 + 2 * d2 + 3 * t) / (3 * (d1 + d2 + 2 * t)),
+    # the first operations broadcast over all inputs, the remaining updates are in place
+    d_sum = d1 + d2
+    den = d_sum + 2 * t
+    den *= 3
 
-    def com_z_rel(r1, r2, h):
-        num = r1 ** 2 + 2 * r1 * r2 + 3 * r2 ** 2
-        den = r1 ** 2 + r1 * r2 + r2 ** 2
-        return h * num / (4 * den)
-
-    # Compute relative center of mass (from bottom), then convert to absolute z
-    V_outer = volume(R1, R2, h)
-    V_inner = volume(r1, r2, h)
-    z_outer_rel = com_z_rel(R1, R2, h)
-    z_inner_rel = com_z_rel(r1, r2, h)
-
-    z_cm_rel = (z_outer_rel * V_outer - z_inner_rel * V_inner) / (V_outer - V_inner)
-    z_cm_abs = z_bot + z_cm_rel
+    z_cm_abs = (z_top - z_bot) * (d_sum + d2 + 3 * t)
+    z_cm_abs /= den
+    z_cm_abs += z_bot
 
     return z_cm_abs
 
 
 def calc_weight(rho, t, z_top, z_bot, d_top, d_bot):
-    rho = np.asarray(rho)
-    t = np.asarray(t)
-    z_top = np.asarray(z_top)
-    z_bot = np.asarray(z_bot)
-    d_top = np.asarray(d_top)
-    d_bot = np.asarray(d_bot)
-
-    h = np.abs(z_top - z_bot)
+    rho = np.asarray(rho, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    z_top = np.asarray(z_top, dtype=np.float64)
+    z_bot = np.asarray(z_bot, dtype=np.float64)
+    d_top = np.asarray(d_top, dtype=np.float64)
+    d_bot = np.asarray(d_bot, dtype=np.float64)
+
     d1 = d_top
     d2 = d_bot
 
-    volume = (1 / 3) * np.pi * h / 4 * (
-            d1 ** 2 + d1 * d2 + d2 ** 2
-            - (d1 - 2 * t) ** 2
-            - (d1 - 2 * t) * (d2 - 2 * t)
-            - (d2 - 2 * t) ** 2
-    )
+    # outer minus inner frustum volume,
+    # pi*h/12 * (d1² + d1*d2 + d2² - (d1-2t)² - (d1-2t)*(d2-2t) - (d2-2t)²), expanded to
+    # pi/2 * h * t * (d1 + d2 - 2t), the first operation broadcasts over all inputs,
+    # the remaining updates are in place
+    weight = (d1 + d2 - 2 * t) * (np.abs(z_top - z_bot) * rho)
+    weight *= t
+    weight *= np.pi / 2
 
-    return rho * volume
+    return weight
 
 
 def add_element(df, z_new):
@@ -140,49 +150,62 @@ def add_element(df, z_new):
     -----
     - If interpolation is successful, the original segment is split, with the lower part ending at the new height,
       and a new row inserted on top with interpolated diameter.
-    - The "Affiliation" of the new row is copied from the original row if the column exists.
+    - All other columns of the new row (e.g. "Affiliation", "t [mm]") are copied from the original row.
+    - The rows have to be ordered from top to bottom (descending "Top [m]"), the segment is found by binary search.
     - No checks are made for column types or values; ensure input DataFrame is clean and valid.
     """
-    df = df.reset_index(drop=True)
-    if len(df.loc[(df["Top [m]"] == z_new) | (df["Bottom [m]"] == z_new)].index) > 0:
+    # the frame is rebuilt from its column arrays below, only reset the index if it is not the default one
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        df = df.reset_index(drop=True)
+    # column positions, looked up once
+    cols = df.columns
+    top_c = cols.get_loc("Top [m]")
+    bot_c = cols.get_loc("Bottom [m]")
+    dtop_c = cols.get_loc("D, top [m]")
+    dbot_c = cols.get_loc("D, bottom [m]")
+
+    top = df.iloc[:, top_c].to_numpy()
+    bot = df.iloc[:, bot_c].to_numpy()
+
+    # sections are ordered top down, the lowest section with its top above the height is the candidate
+    n_above = np.searchsorted(-top, -z_new)
+    if (n_above < len(top) and top[n_above] == z_new) or (n_above > 0 and bot[n_above - 1] == z_new):
         return df
 
-    id_inter = df.loc[(df["Top [m]"] > z_new) & (df["Bottom [m]"] < z_new)].index
-    if len(id_inter) == 0:
+    id_inter = n_above - 1
+    if id_inter < 0 or not bot[id_inter] < z_new:
         print("interpolation not possible, outside bounds")
         return df
-    if len(id_inter) > 1:
+    if id_inter > 0 and bot[id_inter - 1] < z_new:
         print("interpolation not possible, structure not consecutive")
         return df
-    id_inter = id_inter[0]
-
-    new_row = pd.DataFrame(columns=df.columns)
-
-    if "Affiliation" in df.columns:
-        new_row.loc[0, "Affiliation"] = df.loc[id_inter, "Affiliation"]
-
-    new_row.loc[0, "t [mm]"] = df.loc[id_inter, "t [mm]"]
-
-    # height
-    new_row.loc[0, "Top [m]"] = z_new
-    new_row.loc[0, "Bottom [m]"] = df.loc[id_inter, "Bottom [m]"]
 
     # diameter interpolation
-    inter_x_rel = (z_new - df.loc[id_inter, "Bottom [m]"]) / (df.loc[id_inter, "Top [m]"] - df.loc[id_inter, "Bottom [m]"])
-    d_inter = (df.loc[id_inter, "D, top [m]"] - df.loc[id_inter, "D, bottom [m]"]) * inter_x_rel + df.loc[id_inter, "D, bottom [m]"]
-    new_row.loc[0, "D, top [m]"] = d_inter
-    new_row.loc[0, "D, bottom [m]"] = df.loc[id_inter, "D, bottom [m]"]
+    d_top = df.iat[id_inter, dtop_c]
+    d_bot = df.iat[id_inter, dbot_c]
+    inter_x_rel = (z_new - bot[id_inter]) / (top[id_inter] - bot[id_inter])
+    d_inter = (d_top - d_bot) * inter_x_rel + d_bot
 
-    df = df.copy()
-    # update original segment
-    df.loc[id_inter, "Bottom [m]"] = z_new
+    # insert new row below the split, a copy of the original row
+    df = df.take(np.insert(np.arange(len(df)), id_inter + 1, id_inter))
+    df.index = pd.RangeIndex(len(df))
 
-    # insert new row
-    df = pd.concat([df.iloc[:id_inter + 1], new_row, df.iloc[id_inter + 1:]]).reset_index(drop=True)
+    # update original segment and give the new row the geometry of the lower part
+    df.iat[id_inter, bot_c] = z_new
+    df.iat[id_inter + 1, top_c] = z_new
+    df.iat[id_inter + 1, dtop_c] = d_inter
 
     return df
 
 
+def _affiliation(name, n):
+    """
+    Return a categorical Affiliation column of length n with all entries set to name.
+    """
+    code = AFFILIATION_DTYPE.categories.get_loc(name)
+    return pd.Categorical.from_codes(np.full(n, code, dtype=np.int8), dtype=AFFILIATION_DTYPE)
+
+
 def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MASSES=None, TOWER_MASSES=None, excel_caller=None, interactive=True, rho=7900, ignore_hovering=False, overlapp_mode="Skirt"):
     """
     Assemble the full offshore wind turbine structure from Monopile (MP), Transition Piece (TP),
@@ -257,30 +280,27 @@ def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MAS
     - Elevations are adjusted to ensure structural continuity from MP → TP → Tower.
     """
 
-    MP_DATA.insert(0, "Affiliation", "MP")
-    TP_DATA.insert(0, "Affiliation", "TP")
-    TOWER_DATA.insert(0, "Affiliation", "TOWER")
+    MP_DATA.insert(0, "Affiliation", _affiliation("MP", len(MP_DATA)))
+    TP_DATA.insert(0, "Affiliation", _affiliation("TP", len(TP_DATA)))
+    TOWER_DATA.insert(0, "Affiliation", _affiliation("TOWER", len(TOWER_DATA)))
     SKIRT = None
     SKIRT_POINTMASS = None
-    # Extract ranges
-    range_MP = MP_DATA["Top [m]"].to_list() + list([MP_DATA["Bottom [m]"].values[-1]])
-    range_TP = TP_DATA["Top [m]"].to_list() + list([TP_DATA["Bottom [m]"].values[-1]])
-
     if interactive:
         if excel_caller is None:
             raise ValueError("excel_caller is None, has to be defined whem interactive is True")
 
-    WHOLE_STRUCTURE = MP_DATA
+    # structure parts from top to bottom, concatenated once at the end
+    STRUCTURE_PARTS = [MP_DATA]
 
     # Assemble MP TP
-    MP_top = range_MP[0]
-    TP_bot = range_TP[-1]
+    MP_top = float(MP_DATA["Top [m]"].iat[0])
+    TP_bot = float(TP_DATA["Bottom [m]"].iat[-1])
 
     if MP_top > TP_bot:
 
         if interactive:
             result = ex.show_message_box(excel_caller,
-                                         f"The MP and the TP are overlapping by {-range_TP[-1] + range_MP[0]}m. Combine stiffness etc as grouted connection (yes) or add as skirt (no)?",
+                                         f"The MP and the TP are overlapping by {-TP_bot + MP_top}m. Combine stiffness etc as grouted connection (yes) or add as skirt (no)?",
                                          buttons="vbYesNo", icon="vbYesNo", )
         else:
             if overlapp_mode == "Grout":
@@ -299,20 +319,24 @@ def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MAS
         elif result == "No":
 
             TP_DATA = add_element(TP_DATA, MP_top)
-            SKIRT = TP_DATA.loc[TP_DATA["Top [m]"] <= MP_top]
-            SKIRT.loc[:, "Affiliation"] = "SKIRT"
+            SKIRT = TP_DATA.loc[TP_DATA["Top [m]"] <= MP_top].copy()
+            SKIRT["Affiliation"] = _affiliation("SKIRT", len(SKIRT))
             SKIRT = SKIRT.drop("Section", axis=1)
-            skirt_weights = calc_weight(rho, SKIRT["t [mm]"].values / 1000, SKIRT["Top [m]"].values, SKIRT["Bottom [m]"].values, SKIRT["D, top [m]"].values,
-                                        SKIRT["D, bottom [m]"].values) / 1000
-            skirt_heihgts = center_of_mass_hollow_frustum(SKIRT["D, bottom [m]"].values, SKIRT["D, top [m]"].values, SKIRT["Bottom [m]"], SKIRT["Top [m]"].values,
-                                                          SKIRT["t [mm]"].values / 1000)
-            skirt_weight = sum(skirt_weights)
+            t_skirt = SKIRT["t [mm]"].to_numpy(dtype=np.float64) / 1000
+            z_top_skirt = SKIRT["Top [m]"].to_numpy(dtype=np.float64)
+            z_bot_skirt = SKIRT["Bottom [m]"].to_numpy(dtype=np.float64)
+            d_top_skirt = SKIRT["D, top [m]"].to_numpy(dtype=np.float64)
+            d_bot_skirt = SKIRT["D, bottom [m]"].to_numpy(dtype=np.float64)
 
-            skirt_center_of_mass = sum([m * h for m, h in zip(list(skirt_weights), list(skirt_heihgts))]) / skirt_weight
+            skirt_weights = calc_weight(rho, t_skirt, z_top_skirt, z_bot_skirt, d_top_skirt, d_bot_skirt) / 1000
+            skirt_heihgts = center_of_mass_hollow_frustum(d_bot_skirt, d_top_skirt, z_bot_skirt, z_top_skirt, t_skirt)
+            skirt_weight = skirt_weights.sum()
+
+            skirt_center_of_mass = float(skirt_weights @ skirt_heihgts) / skirt_weight
 
             # cut TP
             TP_DATA = TP_DATA.loc[TP_DATA["Bottom [m]"] >= MP_top]
-            WHOLE_STRUCTURE = pd.concat([TP_DATA, WHOLE_STRUCTURE], axis=0)
+            STRUCTURE_PARTS.insert(0, TP_DATA)
 
             SKIRT_POINTMASS = pd.DataFrame(columns=["Affiliation", "Elevation [m]", "Mass [t]", "comment"], index=[0])
             SKIRT_POINTMASS.loc[:, "Affiliation"] = "SKIRT"
@@ -323,7 +347,7 @@ def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MAS
     elif MP_top < TP_bot:
         if interactive:
             ex.show_message_box(excel_caller,
-                               f"The Top of the MP at {range_MP[0]} is lower than the Bottom of the TP at {range_TP[-1]}, so the TP is hovering midair at {range_TP[-1] - range_MP[0]}m over the MP. This cant work, aborting.")
+                               f"The Top of the MP at {MP_top} is lower than the Bottom of the TP at {TP_bot}, so the TP is hovering midair at {TP_bot - MP_top}m over the MP. This cant work, aborting.")
         if not ignore_hovering:
             raise ValueError
 
@@ -331,19 +355,19 @@ def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MAS
         if interactive:
             ex.show_message_box(excel_caller, f"The MP and the TP are fitting together perfectly")
 
-        WHOLE_STRUCTURE = pd.concat([TP_DATA, WHOLE_STRUCTURE], axis=0)
+        STRUCTURE_PARTS.insert(0, TP_DATA)
 
     if TOWER_DATA is not None:
         # Add Tower
-        tower_offset = WHOLE_STRUCTURE["Top [m]"].values[0] - TOWER_DATA["Bottom [m]"].values[-1]
+        tower_offset = STRUCTURE_PARTS[0]["Top [m]"].values[0] - TOWER_DATA["Bottom [m]"].values[-1]
         TOWER_DATA["Top [m]"] = TOWER_DATA["Top [m]"] + tower_offset
         TOWER_DATA["Bottom [m]"] = TOWER_DATA["Bottom [m]"] + tower_offset
 
-        WHOLE_STRUCTURE = pd.concat([TOWER_DATA, WHOLE_STRUCTURE], axis=0)
+        STRUCTURE_PARTS.insert(0, TOWER_DATA)
 
-        WHOLE_STRUCTURE.rename(columns={"Section": "local Section"}, inplace=True)
-        WHOLE_STRUCTURE = WHOLE_STRUCTURE.reset_index(drop=True)
-        WHOLE_STRUCTURE.insert(0, "Section", WHOLE_STRUCTURE.index.values + 1)
+    WHOLE_STRUCTURE = pd.concat(STRUCTURE_PARTS, axis=0, ignore_index=True)
+    WHOLE_STRUCTURE.rename(columns={"Section": "local Section"}, inplace=True)
+    WHOLE_STRUCTURE.insert(0, "Section", np.arange(1, len(WHOLE_STRUCTURE) + 1, dtype=np.int32))
 
     all_masses = []
     if MP_MASSES is not None:
@@ -362,7 +386,7 @@ def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MAS
         all_masses.append(TOWER_MASSES)
 
     if len(all_masses) != 0:
-        ALL_MASSES = pd.concat(all_masses, axis=0)
+        ALL_MASSES = pd.concat(all_masses, axis=0, ignore_index=True)
         ALL_MASSES.sort_values(inplace=True, ascending=False, axis=0, by=["Top [m]"])
     else:
         ALL_MASSES = None
@@ -372,25 +396,37 @@ def assemble_structure(MP_DATA, TP_DATA, TOWER_DATA=None, MP_MASSES=None, TP_MAS
 
 def assemble_structure_excel(excel_caller, rho, RNA_config):
     def all_same_ignoring_none(*values):
-        non_none = [v for v in values if v is not None]
-        return len(non_none) <= 1 or all(v == non_none[0] for v in non_none)
+        return len({v for v in values if v is not None}) <= 1
 
     excel_filename = os.path.basename(excel_caller)
     # load structure Data
-    MP_DATA = ex.read_excel_table(excel_filename, "BuildYourStructure", "MP_DATA")
-    TP_DATA = ex.read_excel_table(excel_filename, "BuildYourStructure", "TP_DATA")
-    TOWER_DATA = ex.read_excel_table(excel_filename, "BuildYourStructure", "TOWER_DATA")
-    RNA_DATA = ex.read_excel_table(excel_filename, "BuildYourStructure", "RNA_DATA")
-
-    MP_META = ex.read_excel_table(excel_filename, "BuildYourStructure", "MP_META")
-    TP_META = ex.read_excel_table(excel_filename, "BuildYourStructure", "TP_META")
-    TOWER_META = ex.read_excel_table(excel_filename, "BuildYourStructure", "TOWER_META")
-    STRUCTURE_META = ex.read_excel_table(excel_filename, "StructureOverview", "STRUCTURE_META")
+    tables = ex.read_excel_tables(excel_filename, [
+        ("BuildYourStructure", "MP_DATA"),
+        ("BuildYourStructure", "TP_DATA"),
+        ("BuildYourStructure", "TOWER_DATA"),
+        ("BuildYourStructure", "RNA_DATA"),
+        ("BuildYourStructure", "MP_META"),
+        ("BuildYourStructure", "TP_META"),
+        ("BuildYourStructure", "TOWER_META"),
+        ("StructureOverview", "STRUCTURE_META"),
+        ("BuildYourStructure", "MP_MASSES", {"dropnan": True}),
+        ("BuildYourStructure", "TP_MASSES", {"dropnan": True}),
+        ("BuildYourStructure", "TOWER_MASSES", {"dropnan": True}),
+    ])
+    MP_DATA = tables["MP_DATA"]
+    TP_DATA = tables["TP_DATA"]
+    TOWER_DATA = tables["TOWER_DATA"]
+    RNA_DATA = tables["RNA_DATA"]
+
+    MP_META = tables["MP_META"]
+    TP_META = tables["TP_META"]
+    TOWER_META = tables["TOWER_META"]
+    STRUCTURE_META = tables["STRUCTURE_META"]
     STRUCTURE_META.loc[:, "Value"] = ""
 
-    MP_MASSES = ex.read_excel_table(excel_filename, "BuildYourStructure", "MP_MASSES", dropnan=True)
-    TP_MASSES = ex.read_excel_table(excel_filename, "BuildYourStructure", "TP_MASSES", dropnan=True)
-    TOWER_MASSES = ex.read_excel_table(excel_filename, "BuildYourStructure", "TOWER_MASSES", dropnan=True)
+    MP_MASSES = tables["MP_MASSES"]
+    TP_MASSES = tables["TP_MASSES"]
+    TOWER_MASSES = tables["TOWER_MASSES"]
 
     # Quality Checks/Warings of single datasets, if any fail fataly, abort
     sucess_MP, MP_DATA = check_convert_structure(excel_filename, MP_DATA, "MP")
@@ -439,14 +475,17 @@ def assemble_structure_excel(excel_caller, rho, RNA_config):
     except ValueError:
         return
 
-    ex.write_df_to_table(excel_filename, "StructureOverview", "WHOLE_STRUCTURE", WHOLE_STRUCTURE)
-    ex.write_df_to_table(excel_filename, "StructureOverview", "ALL_ADDED_MASSES", ALL_MASSES)
-    ex.write_df_to_table(excel_filename, "StructureOverview", "STRUCTURE_META", STRUCTURE_META)
-
+    overview_tables = [
+        ("WHOLE_STRUCTURE", WHOLE_STRUCTURE),
+        ("ALL_ADDED_MASSES", ALL_MASSES),
+        ("STRUCTURE_META", STRUCTURE_META),
+    ]
     if SKIRT is not None:
-        ex.write_df_to_table(excel_filename, "StructureOverview", "SKIRT", SKIRT)
+        overview_tables.append(("SKIRT", SKIRT))
     if SKIRT_POINTMASS is not None:
-        ex.write_df_to_table(excel_filename, "StructureOverview", "SKIRT_POINTMASS", SKIRT_POINTMASS)
+        overview_tables.append(("SKIRT_POINTMASS", SKIRT_POINTMASS))
+
+    ex.write_df_to_tables(excel_filename, "StructureOverview", overview_tables)
 
     return
 
@@ -457,19 +496,26 @@ def move_structure(excel_filename, displ, Structure):
     except ValueError:
         ex.show_message_box(excel_filename, f"Please enter a valid float value for the displacement.")
         return
-    META_CURR = ex.read_excel_table(excel_filename, "BuildYourStructure", f"{Structure}_META", dtype=str)
-    DATA_CURR = ex.read_excel_table(excel_filename, "BuildYourStructure", f"{Structure}_DATA", dtype=float)
-    MASSES_CURR = ex.read_excel_table(excel_filename, "BuildYourStructure", f"{Structure}_MASSES")
-
-    META_CURR.loc[:, "Height Reference"] = None
-    DATA_CURR.loc[:, "Top [m]"] = DATA_CURR.loc[:, "Top [m]"] + displ
-    DATA_CURR.loc[:, "Bottom [m]"] = DATA_CURR.loc[:, "Bottom [m]"] + displ
-    MASSES_CURR.loc[:, "Top [m]"] = MASSES_CURR.loc[:, "Top [m]"] + displ
-    MASSES_CURR.loc[:, "Bottom [m]"] = MASSES_CURR.loc[:, "Bottom [m]"] + displ
-
-    ex.write_df_to_table(excel_filename, "BuildYourStructure", f"{Structure}_META", META_CURR)
-    ex.write_df_to_table(excel_filename, "BuildYourStructure", f"{Structure}_DATA", DATA_CURR)
-    ex.write_df_to_table(excel_filename, "BuildYourStructure", f"{Structure}_MASSES", MASSES_CURR)
+    tables = ex.read_excel_tables(excel_filename, [
+        ("BuildYourStructure", f"{Structure}_META", {"dtype": str}),
+        ("BuildYourStructure", f"{Structure}_DATA", {"dtype": float}),
+        ("BuildYourStructure", f"{Structure}_MASSES"),
+    ])
+    META_CURR = tables[f"{Structure}_META"]
+    DATA_CURR = tables[f"{Structure}_DATA"]
+    MASSES_CURR = tables[f"{Structure}_MASSES"]
+
+    META_CURR["Height Reference"] = None
+    DATA_CURR["Top [m]"] += displ
+    DATA_CURR["Bottom [m]"] += displ
+    MASSES_CURR["Top [m]"] += displ
+    MASSES_CURR["Bottom [m]"] += displ
+
+    ex.write_df_to_tables(excel_filename, "BuildYourStructure", [
+        (f"{Structure}_META", META_CURR),
+        (f"{Structure}_DATA", DATA_CURR),
+        (f"{Structure}_MASSES", MASSES_CURR),
+    ])
 
 
 def move_structure_MP(excel_caller, displ):